@@ -1,563 +1,637 @@
-"""
-Voltorb Flip - Python Implementation
-
-DESCRIPTION:
-Voltorb Flip is a grid-based puzzle card game inspired by the minigame from the Pokémon series.
-The objective of the game is to uncover cards in a grid without flipping over a "Voltorb".
-Cards can contain multipliers (x2 or x3) or a safe value of x1. Voltorbs end the game if flipped.
-Your goal is to maximize your score by uncovering cards with multipliers while avoiding Voltorbs.
-
-This implementation recreates the experience of Voltorb Flip using Python and Pygame. 
-Players interact with the grid by left-clicking to reveal a card or right-clicking to mark 
-a suspected Voltorb with an exclamation mark ("!"). The game dynamically tracks scores and 
-progress, and includes features such as level progression, random level decreases, and 
-persistent scoring across sessions.
-
-CREDITS:
-The concept for Voltorb Flip comes from the Pokémon series, developed by Game Freak and 
-published by Nintendo and The Pokémon Company. This implementation is an independent 
-project inspired by the minigame, created for educational purposes.
-
-REQUIREMENTS:
-- Python 3.x
-- Pygame library
-
-To install Pygame, use the following command:
-    pip install pygame
-
-HOW TO PLAY:
-1. Objective:
-   - Your goal is to uncover cards with multipliers (x2 or x3) to maximize your score.
-   - The level is over when all x2 and x3 cards have been revealed. 
-   - Avoid flipping over Voltorbs, as they will end the game.
-
-2. Controls:
-   - Left-click: Reveal a card.
-   - Right-click: Mark/unmark a card as a suspected Voltorb.
-
-3. Scoring:
-   - Each card you flip contributes to your current round score.
-   - As the score is multiplicative, x1 cards do nothing for your score and do not progress the game. 
-   - If you win the level, your current score is added to your total score.
-   - Your total score persists across sessions.
-
-4. Level Progression:
-   - Levels increase in difficulty as you progress.
-   - If you lose a level, there is a chance your level may decrease:
-     - Small chance of dropping by 1 or 2 levels.
-     - Very small chance of resetting to Level 1.
-
-5. Other Features:
-   - Persistent High Score: Tracks your highest total score across sessions.
-   - Level Hints: Displays row and column hints to help you strategize.
-   - Mark cards: Use the right-click to mark cards as suspected Voltorbs.
-
-6. Game Menu:
-   - Spend Points: Use 100 points from your total score to skip a level.
-   - Reset Score: Reset your total score to start fresh.
-
-7. Winning and Losing:
-   - Winning a level adds your current round score to your total score.
-   - Losing ends the round, and your level may decrease based on random chance.
-
-Enjoy playing Voltorb Flip and strive for the highest score!
-
-More details about the game can be found at:
-https://bulbapedia.bulbagarden.net/wiki/Voltorb_Flip
-
-"""
-
-import pygame
-import random
-import sys
-import pickle
-import os
-
-# Initialize Pygame
-pygame.init()
-
-# Constants
-BOARD_SIZE = 5  # 5x5 grid
-CELL_SIZE = 80
-CELL_MARGIN = 5
-SIDEBAR_WIDTH = 220  # Width of the sidebar for text
-
-# Calculate dynamic screen width
-SCREEN_WIDTH = SIDEBAR_WIDTH + (CELL_SIZE + CELL_MARGIN) * 1.25 * BOARD_SIZE
-SCREEN_HEIGHT = (CELL_SIZE + CELL_MARGIN) * BOARD_SIZE + 150  # Extra space for column hints and messages
-
-# Colors
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-GRAY = (150, 150, 150)
-LIGHT_GRAY = (200, 200, 200)
-RED = (255, 0, 0)
-SEMI_TRANSPARENT_BG = (255, 255, 255, 200)  # For message backgrounds
-
-# Fonts
-title_font = pygame.font.SysFont(None, 40)    # For main titles
-score_font = pygame.font.SysFont(None, 28)    # For level and scores
-small_font = pygame.font.SysFont(None, 22)    # For smaller text
-
-# Screen setup
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Voltorb Flip")
-
-# Level configurations
-LEVEL_CONFIGURATIONS = {
-    1: [
-        {'2s': 3, '3s': 1, 'Voltorbs': 6},
-        {'2s': 0, '3s': 3, 'Voltorbs': 6},
-        {'2s': 5, '3s': 0, 'Voltorbs': 6},
-        {'2s': 2, '3s': 2, 'Voltorbs': 6},
-        {'2s': 4, '3s': 1, 'Voltorbs': 6},
-    ],
-    2: [
-        {'2s': 1, '3s': 3, 'Voltorbs': 7},
-        {'2s': 6, '3s': 0, 'Voltorbs': 7},
-        {'2s': 3, '3s': 2, 'Voltorbs': 7},
-        {'2s': 0, '3s': 4, 'Voltorbs': 7},
-        {'2s': 5, '3s': 1, 'Voltorbs': 7},
-    ],
-    3: [
-        {'2s': 2, '3s': 3, 'Voltorbs': 8},
-        {'2s': 7, '3s': 0, 'Voltorbs': 8},
-        {'2s': 4, '3s': 2, 'Voltorbs': 8},
-        {'2s': 1, '3s': 4, 'Voltorbs': 8},
-        {'2s': 6, '3s': 1, 'Voltorbs': 8},
-    ],
-    4: [
-        {'2s': 3, '3s': 3, 'Voltorbs': 8},
-        {'2s': 0, '3s': 5, 'Voltorbs': 8},
-        {'2s': 8, '3s': 0, 'Voltorbs': 10},
-        {'2s': 5, '3s': 2, 'Voltorbs': 10},
-        {'2s': 2, '3s': 4, 'Voltorbs': 10},
-    ],
-    5: [
-        {'2s': 7, '3s': 1, 'Voltorbs': 10},
-        {'2s': 4, '3s': 3, 'Voltorbs': 10},
-        {'2s': 1, '3s': 5, 'Voltorbs': 10},
-        {'2s': 9, '3s': 0, 'Voltorbs': 10},
-        {'2s': 6, '3s': 2, 'Voltorbs': 10},
-    ],
-    6: [
-        {'2s': 3, '3s': 4, 'Voltorbs': 10},
-        {'2s': 0, '3s': 6, 'Voltorbs': 10},
-        {'2s': 8, '3s': 1, 'Voltorbs': 10},
-        {'2s': 5, '3s': 3, 'Voltorbs': 10},
-        {'2s': 2, '3s': 5, 'Voltorbs': 10},
-    ],
-    7: [
-        {'2s': 7, '3s': 2, 'Voltorbs': 10},
-        {'2s': 4, '3s': 4, 'Voltorbs': 10},
-        {'2s': 1, '3s': 6, 'Voltorbs': 13},
-        {'2s': 9, '3s': 1, 'Voltorbs': 13},
-        {'2s': 6, '3s': 3, 'Voltorbs': 10},
-    ],
-    8: [
-        {'2s': 0, '3s': 7, 'Voltorbs': 10},
-        {'2s': 8, '3s': 2, 'Voltorbs': 10},
-        {'2s': 5, '3s': 4, 'Voltorbs': 10},
-        {'2s': 2, '3s': 6, 'Voltorbs': 10},
-        {'2s': 7, '3s': 3, 'Voltorbs': 10},
-    ],
-}
-
-class Cell:
-    def __init__(self, value, is_voltorb):
-        self.value = value
-        self.is_voltorb = is_voltorb
-        self.flipped = False
-        self.marked = False  # For '!' marks
-
-class Board:
-    def __init__(self, level, total_score):
-        self.level = level
-        self.board = self.generate_board()
-        self.row_hints, self.col_hints = self.calculate_hints()
-        self.score = 1  # Current round score
-        self.total_score = total_score
-        self.game_over = False
-        self.win = False
-
-    def generate_board(self):
-        # The level configurations are assumed to be provided
-        configurations = LEVEL_CONFIGURATIONS.get(
-            self.level, LEVEL_CONFIGURATIONS[max(LEVEL_CONFIGURATIONS.keys())]
-        )
-        config = random.choice(configurations)
-        num_2s = config['2s']
-        num_3s = config['3s']
-        num_voltorbs = config['Voltorbs']
-
-        cells = []
-
-        # Add Voltorbs
-        for _ in range(num_voltorbs):
-            cells.append(Cell(0, True))
-
-        # Add ×2 cells
-        for _ in range(num_2s):
-            cells.append(Cell(2, False))
-
-        # Add ×3 cells
-        for _ in range(num_3s):
-            cells.append(Cell(3, False))
-
-        # Add ×1 cells
-        total_cells = BOARD_SIZE * BOARD_SIZE
-        num_1s = total_cells - num_voltorbs - num_2s - num_3s
-        for _ in range(num_1s):
-            cells.append(Cell(1, False))
-
-        random.shuffle(cells)
-        board = [cells[i * BOARD_SIZE:(i + 1) * BOARD_SIZE] for i in range(BOARD_SIZE)]
-        return board
-
-    def calculate_hints(self):
-        row_hints = []
-        col_hints = []
-
-        for i in range(BOARD_SIZE):
-            row_voltorbs = 0
-            row_points = 0
-            col_voltorbs = 0
-            col_points = 0
-            for j in range(BOARD_SIZE):
-                # Row calculations
-                cell = self.board[i][j]
-                if cell.is_voltorb:
-                    row_voltorbs += 1
-                else:
-                    row_points += cell.value
-
-                # Column calculations
-                cell = self.board[j][i]
-                if cell.is_voltorb:
-                    col_voltorbs += 1
-                else:
-                    col_points += cell.value
-
-            row_hints.append((row_points, row_voltorbs))
-            col_hints.append((col_points, col_voltorbs))
-
-        return row_hints, col_hints
-
-    def check_win(self):
-        for row in self.board:
-            for cell in row:
-                if cell.value > 1 and not cell.flipped:
-                    return False
-        return True
-
-    def flip_cell(self, row, col):
-        cell = self.board[row][col]
-        if cell.flipped:
-            return
-        cell.flipped = True
-        if cell.is_voltorb:
-            self.game_over = True
-        else:
-            if cell.value > 1:
-                self.score *= cell.value
-            if self.check_win():
-                self.win = True
-
-    def toggle_mark(self, row, col):
-        cell = self.board[row][col]
-        if not cell.flipped:
-            cell.marked = not cell.marked
-
-def calculate_level_decrease(level):
-    baseline_chance = 0.1  # 10%
-    per_level_increase = 0.05  # 5% per level above 1
-    total_decrease_chance = baseline_chance + (level - 1) * per_level_increase
-    if total_decrease_chance > 0.9:
-        total_decrease_chance = 0.9  # Cap the total chance at 90%
-
-    rand_value = random.random()
-
-    if rand_value < total_decrease_chance:
-        # Level will decrease
-        # Now decide how much it will decrease
-        # Define weights for the types of decrease
-        chance_decrease_1 = 0.7  # 70% chance within decrease chance
-        chance_decrease_2 = 0.2  # 20% chance
-        chance_critical_decrease = 0.1  # 10% chance
-
-        rand_decrease = random.random()
-
-        if rand_decrease < chance_decrease_1:
-            # Decrease level by 1
-            new_level = max(1, level - 1)
-            return new_level, "decreased by 1"
-        elif rand_decrease < chance_decrease_1 + chance_decrease_2:
-            # Decrease level by 2
-            new_level = max(1, level - 2)
-            return new_level, "decreased by 2"
-        else:
-            # Critical decrease to level 1
-            new_level = 1
-            return new_level, "reset to Level 1"
-    else:
-        # Level remains the same
-        return level, "no change"
-
-def draw_board(screen, board, high_score, level_decrease_message=""):
-    # Adjusted margins to account for the sidebar
-    x_margin = SIDEBAR_WIDTH + ((SCREEN_WIDTH - SIDEBAR_WIDTH - (CELL_SIZE + CELL_MARGIN) * BOARD_SIZE) // 2)
-    y_margin = 50  # Starting from 50 pixels down to leave space for top texts
-
-    # Draw cells
-    for row in range(BOARD_SIZE):
-        for col in range(BOARD_SIZE):
-            cell = board.board[row][col]
-            cell_rect = pygame.Rect(
-                x_margin + col * (CELL_SIZE + CELL_MARGIN),
-                y_margin + row * (CELL_SIZE + CELL_MARGIN),
-                CELL_SIZE,
-                CELL_SIZE,
-            )
-            if cell.flipped:
-                if cell.is_voltorb:
-                    pygame.draw.rect(screen, RED, cell_rect)
-                    text = score_font.render("V", True, BLACK)
-                    text_rect = text.get_rect(center=cell_rect.center)
-                    screen.blit(text, text_rect)
-                else:
-                    pygame.draw.rect(screen, LIGHT_GRAY, cell_rect)
-                    text = score_font.render(str(cell.value), True, BLACK)
-                    text_rect = text.get_rect(center=cell_rect.center)
-                    screen.blit(text, text_rect)
-            else:
-                pygame.draw.rect(screen, GRAY, cell_rect)
-                if cell.marked:
-                    text = score_font.render("!", True, BLACK)
-                    text_rect = text.get_rect(center=cell_rect.center)
-                    screen.blit(text, text_rect)
-            pygame.draw.rect(screen, BLACK, cell_rect, 1)
-
-    # Draw row hints
-    for row in range(BOARD_SIZE):
-        points, voltorbs = board.row_hints[row]
-        hint_text = small_font.render(f"{points}/{voltorbs}", True, BLACK)
-        hint_rect = hint_text.get_rect()
-        hint_rect.midleft = (
-            x_margin + BOARD_SIZE * (CELL_SIZE + CELL_MARGIN) + 10,
-            y_margin + row * (CELL_SIZE + CELL_MARGIN) + CELL_SIZE // 2,
-        )
-        screen.blit(hint_text, hint_rect)
-
-    # Draw column hints
-    for col in range(BOARD_SIZE):
-        points, voltorbs = board.col_hints[col]
-        hint_text = small_font.render(f"{points}/{voltorbs}", True, BLACK)
-        hint_rect = hint_text.get_rect()
-        hint_rect.midtop = (
-            x_margin + col * (CELL_SIZE + CELL_MARGIN) + CELL_SIZE // 2,
-            y_margin + BOARD_SIZE * (CELL_SIZE + CELL_MARGIN) + 10,
-        )
-        screen.blit(hint_text, hint_rect)
-
-    # Sidebar positioning
-    sidebar_x = 10  # Padding from the left edge
-    sidebar_y = 50  # Starting y position
-    line_height = 40  # Space between lines
-
-    # Level Text
-    level_text = score_font.render(f"Level: {board.level}", True, BLACK)
-    level_rect = level_text.get_rect(topleft=(sidebar_x, sidebar_y))
-    screen.blit(level_text, level_rect)
-
-    # Current Points Text
-    score_text = score_font.render(f"Current Points: {board.score}", True, BLACK)
-    score_rect = score_text.get_rect(topleft=(sidebar_x, sidebar_y + line_height))
-    screen.blit(score_text, score_rect)
-
-    # Total Score Text
-    total_score_text = score_font.render(f"Total Score: {board.total_score}", True, BLACK)
-    total_score_rect = total_score_text.get_rect(topleft=(sidebar_x, sidebar_y + 2 * line_height))
-    screen.blit(total_score_text, total_score_rect)
-
-    # High Score Text
-    high_score_text = score_font.render(f"High Score: {high_score}", True, BLACK)
-    high_score_rect = high_score_text.get_rect(topleft=(sidebar_x, sidebar_y + 3 * line_height))
-    screen.blit(high_score_text, high_score_rect)
-
-    # Game over or win messages with background for better readability
-    if board.game_over:
-        # Semi-transparent background
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill(SEMI_TRANSPARENT_BG)
-        screen.blit(overlay, (0, 0))
-
-        game_over_text = title_font.render("Game Over!", True, RED)
-        game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60))
-        screen.blit(game_over_text, game_over_rect)
-
-        # Display level decrease message if any
-        if level_decrease_message:
-            decrease_text = score_font.render(level_decrease_message, True, BLACK)
-            decrease_rect = decrease_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20))
-            screen.blit(decrease_text, decrease_rect)
-
-        restart_text = small_font.render("Press Enter to continue", True, BLACK)
-        restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
-        screen.blit(restart_text, restart_rect)
-
-    if board.win:
-        # Semi-transparent background
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill(SEMI_TRANSPARENT_BG)
-        screen.blit(overlay, (0, 0))
-
-        win_text = title_font.render("Level Cleared!", True, BLACK)
-        win_rect = win_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20))
-        screen.blit(win_text, win_rect)
-
-        next_level_text = small_font.render("Press Enter to continue", True, BLACK)
-        next_level_rect = next_level_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
-        screen.blit(next_level_text, next_level_rect)
-
-def save_score(total_score, high_score):
-    with open('score.dat', 'wb') as f:
-        pickle.dump({'total_score': total_score, 'high_score': high_score}, f)
-
-def load_score():
-    if os.path.exists('score.dat'):
-        with open('score.dat', 'rb') as f:
-            data = pickle.load(f)
-            if isinstance(data, dict):
-                total_score = data.get('total_score', 0)
-                high_score = data.get('high_score', 0)
-            else:
-                # Data is an int (from previous version), so use it as total_score
-                total_score = data
-                high_score = 0  # Set high_score to zero or any default value
-            return total_score, high_score
-    else:
-        return 0, 0
-
-def main():
-    total_score, high_score = load_score()
-    level = 1
-    board = Board(level, total_score)
-    clock = pygame.time.Clock()
-    running = True
-    show_level_menu = True  # To choose level or spend points
-    level_decrease_message = ""
-
-    while running:
-        # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                save_score(board.total_score, high_score)
-                running = False
-                break
-
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if not board.game_over and not board.win and not show_level_menu:
-                    mouse_pos = pygame.mouse.get_pos()
-                    # Calculate which cell was clicked
-                    x_margin = SIDEBAR_WIDTH + ((SCREEN_WIDTH - SIDEBAR_WIDTH - (CELL_SIZE + CELL_MARGIN) * BOARD_SIZE) // 2)
-                    y_margin = 50  # Starting from 50 pixels down
-
-                    for row in range(BOARD_SIZE):
-                        for col in range(BOARD_SIZE):
-                            cell_rect = pygame.Rect(
-                                x_margin + col * (CELL_SIZE + CELL_MARGIN),
-                                y_margin + row * (CELL_SIZE + CELL_MARGIN),
-                                CELL_SIZE,
-                                CELL_SIZE,
-                            )
-                            if cell_rect.collidepoint(mouse_pos):
-                                if event.button == 1:  # Left click
-                                    board.flip_cell(row, col)
-                                elif event.button == 3:  # Right click
-                                    board.toggle_mark(row, col)
-                                break
-
-            elif event.type == pygame.KEYDOWN:
-                # Accept both Enter keys
-                if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
-                    if show_level_menu:
-                        show_level_menu = False
-                        level_decrease_message = ""
-                    elif board.win:
-                        # Add current round score to total score
-                        board.total_score += board.score
-                        if board.total_score > high_score:
-                            high_score = board.total_score
-                        save_score(board.total_score, high_score)
-                        level = board.level + 1
-                        board = Board(level, board.total_score)
-                        show_level_menu = True
-                    elif board.game_over:
-                        # Lose current round score
-                        # Apply level decrease logic
-                        new_level, decrease_message = calculate_level_decrease(level)
-                        level_decrease_message = f"Your level has {decrease_message}."
-                        level = new_level
-                        if board.total_score > high_score:
-                            high_score = board.total_score
-                        save_score(board.total_score, high_score)
-                        board = Board(level, board.total_score)
-                        show_level_menu = True
-                elif event.key == pygame.K_s and show_level_menu:
-                    # Spend points to increase level
-                    if board.total_score >= 100:
-                        board.total_score -= 100
-                        level += 1
-                        board = Board(level, board.total_score)
-                        save_score(board.total_score, high_score)
-                elif event.key == pygame.K_r and show_level_menu:
-                    # Reset total score
-                    board.total_score = 0
-                    save_score(board.total_score, high_score)
-
-        # Draw everything
-        screen.fill(WHITE)
-        if show_level_menu:
-            # Display level and options to spend points
-            # Center x position for menu text (adjusted for sidebar)
-            menu_center_x = SIDEBAR_WIDTH + ((SCREEN_WIDTH - SIDEBAR_WIDTH) // 2)
-
-            # Semi-transparent background for menu
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill(SEMI_TRANSPARENT_BG)
-            screen.blit(overlay, (0, 0))
-
-            menu_text = title_font.render(f"Current Level: {level}", True, BLACK)
-            menu_rect = menu_text.get_rect(center=(menu_center_x, SCREEN_HEIGHT // 2 - 120))
-            screen.blit(menu_text, menu_rect)
-
-            points_text = title_font.render(f"Total Score: {board.total_score}", True, BLACK)
-            points_rect = points_text.get_rect(center=(menu_center_x, SCREEN_HEIGHT // 2 - 80))
-            screen.blit(points_text, points_rect)
-
-            high_score_text = title_font.render(f"High Score: {high_score}", True, BLACK)
-            high_score_rect = high_score_text.get_rect(center=(menu_center_x, SCREEN_HEIGHT // 2 - 40))
-            screen.blit(high_score_text, high_score_rect)
-
-            instructions = [
-                "Press Enter to start the game",
-                "Press 'S' to spend 100 points to increase level",
-                "Press 'R' to reset total score",
-                "Left-click to reveal a cell",
-                "Right-click to mark/unmark a cell",
-            ]
-
-            for i, line in enumerate(instructions):
-                instr_text = small_font.render(line, True, BLACK)
-                instr_rect = instr_text.get_rect(center=(menu_center_x, SCREEN_HEIGHT // 2 + i * 30))
-                screen.blit(instr_text, instr_rect)
-        else:
-            draw_board(screen, board, high_score, level_decrease_message)
-        pygame.display.flip()
-        clock.tick(30)
-
-    pygame.quit()
-    sys.exit()
-
-if __name__ == "__main__":
-    main()
+"""
+Voltorb Flip - Python Implementation
+
+DESCRIPTION:
+Voltorb Flip is a grid-based puzzle card game inspired by the minigame from the Pokémon series.
+The objective of the game is to uncover cards in a grid without flipping over a "Voltorb".
+Cards can contain multipliers (x2 or x3) or a safe value of x1. Voltorbs end the game if flipped.
+Your goal is to maximize your score by uncovering cards with multipliers while avoiding Voltorbs.
+
+This implementation recreates the experience of Voltorb Flip using Python and Pygame. 
+Players interact with the grid by left-clicking to reveal a card or right-clicking to mark 
+a suspected Voltorb with an exclamation mark ("!"). The game dynamically tracks scores and 
+progress, and includes features such as level progression, random level decreases, and 
+persistent scoring across sessions.
+
+CREDITS:
+The concept for Voltorb Flip comes from the Pokémon series, developed by Game Freak and 
+published by Nintendo and The Pokémon Company. This implementation is an independent 
+project inspired by the minigame, created for educational purposes.
+
+REQUIREMENTS:
+- Python 3.x
+- Pygame library
+- NumPy library
+
+To install the dependencies, use the following command:
+    pip install pygame numpy
+
+HOW TO PLAY:
+1. Objective:
+   - Your goal is to uncover cards with multipliers (x2 or x3) to maximize your score.
+   - The level is over when all x2 and x3 cards have been revealed. 
+   - Avoid flipping over Voltorbs, as they will end the game.
+
+2. Controls:
+   - Left-click: Reveal a card.
+   - Right-click: Mark/unmark a card as a suspected Voltorb.
+
+3. Scoring:
+   - Each card you flip contributes to your current round score.
+   - As the score is multiplicative, x1 cards do nothing for your score and do not progress the game. 
+   - If you win the level, your current score is added to your total score.
+   - Your total score persists across sessions.
+
+4. Level Progression:
+   - Levels increase in difficulty as you progress.
+   - If you lose a level, there is a chance your level may decrease:
+     - Small chance of dropping by 1 or 2 levels.
+     - Very small chance of resetting to Level 1.
+
+5. Other Features:
+   - Persistent High Score: Tracks your highest total score across sessions.
+   - Level Hints: Displays row and column hints to help you strategize.
+   - Mark cards: Use the right-click to mark cards as suspected Voltorbs.
+
+6. Game Menu:
+   - Spend Points: Use 100 points from your total score to skip a level.
+   - Reset Score: Reset your total score to start fresh.
+
+7. Winning and Losing:
+   - Winning a level adds your current round score to your total score.
+   - Losing ends the round, and your level may decrease based on random chance.
+
+Enjoy playing Voltorb Flip and strive for the highest score!
+
+More details about the game can be found at:
+https://bulbapedia.bulbagarden.net/wiki/Voltorb_Flip
+
+"""
+
+import pygame
+import random
+import sys
+import pickle
+import struct
+import os
+
+import numpy as np
+
+# Shared generator for board shuffles
+_rng = np.random.default_rng()
+
+# Initialize Pygame
+pygame.init()
+
+# Constants
+BOARD_SIZE = 5  # 5x5 grid
+CELL_SIZE = 80
+CELL_MARGIN = 5
+SIDEBAR_WIDTH = 220  # Width of the sidebar for text
+
+# Calculate dynamic screen width
+SCREEN_WIDTH = SIDEBAR_WIDTH + (CELL_SIZE + CELL_MARGIN) * 1.25 * BOARD_SIZE
+SCREEN_HEIGHT = (CELL_SIZE + CELL_MARGIN) * BOARD_SIZE + 150  # Extra space for column hints and messages
+
+# Board geometry, constant for the life of the program
+X_MARGIN = SIDEBAR_WIDTH + ((SCREEN_WIDTH - SIDEBAR_WIDTH - (CELL_SIZE + CELL_MARGIN) * BOARD_SIZE) // 2)
+Y_MARGIN = 50  # Leaves space for the top texts
+CELL_RECTS = [
+    [
+        pygame.Rect(
+            X_MARGIN + col * (CELL_SIZE + CELL_MARGIN),
+            Y_MARGIN + row * (CELL_SIZE + CELL_MARGIN),
+            CELL_SIZE,
+            CELL_SIZE,
+        )
+        for col in range(BOARD_SIZE)
+    ]
+    for row in range(BOARD_SIZE)
+]
+BOARD_SPAN = BOARD_SIZE * (CELL_SIZE + CELL_MARGIN)  # Pixel extent of the grid
+FULL_BOARD_MASK = (1 << (BOARD_SIZE * BOARD_SIZE)) - 1  # One bit per cell
+SIDEBAR_RECT = pygame.Rect(0, 0, SIDEBAR_WIDTH, SCREEN_HEIGHT)
+ROW_HINT_STRIP_POS = (X_MARGIN + BOARD_SPAN + 10, Y_MARGIN)
+COL_HINT_STRIP_POS = (X_MARGIN, Y_MARGIN + BOARD_SPAN + 10)
+
+# Top-left anchors of the sidebar texts, 40 px apart
+SIDEBAR_TEXT_POS = {
+    'level': (10, 50),
+    'score': (10, 90),
+    'total_score': (10, 130),
+    'high_score': (10, 170),
+}
+
+# Colors
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+GRAY = (150, 150, 150)
+LIGHT_GRAY = (200, 200, 200)
+RED = (255, 0, 0)
+SEMI_TRANSPARENT_BG = (255, 255, 255, 200)  # For message backgrounds
+
+# Fonts. A bundled TTF loads without scanning the system font list and
+# keeps glyph metrics identical across platforms; fall back to the
+# default system font when no font.ttf ships next to the script.
+_FONT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'font.ttf')
+
+def _load_font(size):
+    if os.path.exists(_FONT_PATH):
+        return pygame.font.Font(_FONT_PATH, size)
+    return pygame.font.SysFont(None, size)
+
+title_font = _load_font(40)    # For main titles
+score_font = _load_font(28)    # For level and scores
+small_font = _load_font(22)    # For smaller text
+
+# Cache of rendered text surfaces, keyed by (font, text, color).
+# Most strings (hints, level, high score) rarely change between frames,
+# so caching avoids re-rasterizing them at every redraw.
+_TEXT_CACHE_MAX = 256
+_text_cache = {}
+
+def render_cached(font, text, color):
+    key = (id(font), text, color)
+    surface = _text_cache.get(key)
+    if surface is None:
+        surface = font.render(text, True, color)
+        if len(_text_cache) >= _TEXT_CACHE_MAX:
+            # Evict the least recently used entry
+            _text_cache.pop(next(iter(_text_cache)))
+        _text_cache[key] = surface
+    else:
+        # Move to the end so frequently used entries survive eviction
+        _text_cache.pop(key)
+        _text_cache[key] = surface
+    return surface
+
+# Cache of (surface, rect) pairs for text drawn at a fixed anchor, so the
+# per-frame get_rect layout call is skipped as well
+_placed_text_cache = {}
+
+def render_cached_at(font, text, color, anchor, pos):
+    key = (id(font), text, color, anchor, pos)
+    entry = _placed_text_cache.get(key)
+    if entry is None:
+        surface = render_cached(font, text, color)
+        rect = surface.get_rect(**{anchor: pos})
+        if len(_placed_text_cache) >= _TEXT_CACHE_MAX:
+            _placed_text_cache.pop(next(iter(_placed_text_cache)))
+        entry = (surface, rect)
+        _placed_text_cache[key] = entry
+    else:
+        _placed_text_cache.pop(key)
+        _placed_text_cache[key] = entry
+    return entry
+
+# Pre-rasterized cell glyphs; flipped or marked cells only ever show these
+GLYPHS = {c: score_font.render(c, True, BLACK) for c in "123V!"}
+
+# Screen setup
+screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+pygame.display.set_caption("Voltorb Flip")
+
+# Shared semi-transparent overlay for the menu and end-of-round messages,
+# allocated once and converted to the display's pixel format
+OVERLAY = pygame.Surface((int(SCREEN_WIDTH), int(SCREEN_HEIGHT)), pygame.SRCALPHA).convert_alpha()
+OVERLAY.fill(SEMI_TRANSPARENT_BG)
+
+# Level configurations
+LEVEL_CONFIGURATIONS = {
+    1: [
+        {'2s': 3, '3s': 1, 'Voltorbs': 6},
+        {'2s': 0, '3s': 3, 'Voltorbs': 6},
+        {'2s': 5, '3s': 0, 'Voltorbs': 6},
+        {'2s': 2, '3s': 2, 'Voltorbs': 6},
+        {'2s': 4, '3s': 1, 'Voltorbs': 6},
+    ],
+    2: [
+        {'2s': 1, '3s': 3, 'Voltorbs': 7},
+        {'2s': 6, '3s': 0, 'Voltorbs': 7},
+        {'2s': 3, '3s': 2, 'Voltorbs': 7},
+        {'2s': 0, '3s': 4, 'Voltorbs': 7},
+        {'2s': 5, '3s': 1, 'Voltorbs': 7},
+    ],
+    3: [
+        {'2s': 2, '3s': 3, 'Voltorbs': 8},
+        {'2s': 7, '3s': 0, 'Voltorbs': 8},
+        {'2s': 4, '3s': 2, 'Voltorbs': 8},
+        {'2s': 1, '3s': 4, 'Voltorbs': 8},
+        {'2s': 6, '3s': 1, 'Voltorbs': 8},
+    ],
+    4: [
+        {'2s': 3, '3s': 3, 'Voltorbs': 8},
+        {'2s': 0, '3s': 5, 'Voltorbs': 8},
+        {'2s': 8, '3s': 0, 'Voltorbs': 10},
+        {'2s': 5, '3s': 2, 'Voltorbs': 10},
+        {'2s': 2, '3s': 4, 'Voltorbs': 10},
+    ],
+    5: [
+        {'2s': 7, '3s': 1, 'Voltorbs': 10},
+        {'2s': 4, '3s': 3, 'Voltorbs': 10},
+        {'2s': 1, '3s': 5, 'Voltorbs': 10},
+        {'2s': 9, '3s': 0, 'Voltorbs': 10},
+        {'2s': 6, '3s': 2, 'Voltorbs': 10},
+    ],
+    6: [
+        {'2s': 3, '3s': 4, 'Voltorbs': 10},
+        {'2s': 0, '3s': 6, 'Voltorbs': 10},
+        {'2s': 8, '3s': 1, 'Voltorbs': 10},
+        {'2s': 5, '3s': 3, 'Voltorbs': 10},
+        {'2s': 2, '3s': 5, 'Voltorbs': 10},
+    ],
+    7: [
+        {'2s': 7, '3s': 2, 'Voltorbs': 10},
+        {'2s': 4, '3s': 4, 'Voltorbs': 10},
+        {'2s': 1, '3s': 6, 'Voltorbs': 13},
+        {'2s': 9, '3s': 1, 'Voltorbs': 13},
+        {'2s': 6, '3s': 3, 'Voltorbs': 10},
+    ],
+    8: [
+        {'2s': 0, '3s': 7, 'Voltorbs': 10},
+        {'2s': 8, '3s': 2, 'Voltorbs': 10},
+        {'2s': 5, '3s': 4, 'Voltorbs': 10},
+        {'2s': 2, '3s': 6, 'Voltorbs': 10},
+        {'2s': 7, '3s': 3, 'Voltorbs': 10},
+    ],
+}
+
+# Levels above the last configured one reuse the hardest configurations
+_MAX_LEVEL = max(LEVEL_CONFIGURATIONS)
+_FALLBACK_CONFIGS = LEVEL_CONFIGURATIONS[_MAX_LEVEL]
+
+class Board:
+    def __init__(self, level, total_score):
+        self.level = level
+        # Board state is stored as parallel (BOARD_SIZE, BOARD_SIZE) arrays
+        # so hint sums and win checks run as NumPy reductions instead of
+        # Python loops over boxed cell objects.
+        self.values = self.generate_board()
+        self.is_voltorb = self.values == 0
+        # Per-cell flags live in bitboards (bit row*BOARD_SIZE+col), so
+        # the win check is a couple of integer operations
+        self.flipped_bb = 0
+        self.marked_bb = 0  # For '!' marks
+        self.voltorb_bb = self._mask_of(self.is_voltorb)
+        self.gt1_mask = self._mask_of(self.values > 1)
+        self.row_hints, self.col_hints = self.calculate_hints()
+        self.row_hint_strip, self.col_hint_strip = self.build_hint_strips()
+        self.score = 1  # Current round score
+        self.total_score = total_score
+        self.game_over = False
+        self.win = False
+        self.dirty = True  # Redraw needed; cleared by the main loop
+        self.dirty_rects = []  # Screen regions changed since the last update
+        self.background = self.build_background()
+
+    @staticmethod
+    def _mask_of(cells):
+        # Pack a (BOARD_SIZE, BOARD_SIZE) boolean array into a bitboard
+        return sum(1 << i for i, hit in enumerate(cells.ravel()) if hit)
+
+    def build_hint_strips(self):
+        # Compose the ten hint labels onto two strips (one per axis) so
+        # the background build blits two surfaces instead of ten texts
+        hint_height = small_font.get_height()
+        strip_width = int(SCREEN_WIDTH) - ROW_HINT_STRIP_POS[0]
+
+        row_strip = pygame.Surface((strip_width, BOARD_SPAN), pygame.SRCALPHA).convert_alpha()
+        for row in range(BOARD_SIZE):
+            points, voltorbs = self.row_hints[row]
+            hint_text = render_cached(small_font, f"{points}/{voltorbs}", BLACK)
+            hint_rect = hint_text.get_rect()
+            hint_rect.midleft = (0, row * (CELL_SIZE + CELL_MARGIN) + CELL_SIZE // 2)
+            row_strip.blit(hint_text, hint_rect)
+
+        col_strip = pygame.Surface((BOARD_SPAN, hint_height), pygame.SRCALPHA).convert_alpha()
+        for col in range(BOARD_SIZE):
+            points, voltorbs = self.col_hints[col]
+            hint_text = render_cached(small_font, f"{points}/{voltorbs}", BLACK)
+            hint_rect = hint_text.get_rect()
+            hint_rect.midtop = (col * (CELL_SIZE + CELL_MARGIN) + CELL_SIZE // 2, 0)
+            col_strip.blit(hint_text, hint_rect)
+
+        return row_strip, col_strip
+
+    def build_background(self):
+        # Pre-render the immutable layer of the board (unflipped cells,
+        # borders and hint labels) so draw_board can restore it with a
+        # single blit instead of redrawing every rect each frame.
+        background = pygame.Surface((int(SCREEN_WIDTH), int(SCREEN_HEIGHT))).convert()
+        background.fill(WHITE)
+
+        # All cells start unflipped and unmarked
+        for row in range(BOARD_SIZE):
+            for col in range(BOARD_SIZE):
+                cell_rect = CELL_RECTS[row][col]
+                pygame.draw.rect(background, GRAY, cell_rect)
+                pygame.draw.rect(background, BLACK, cell_rect, 1)
+
+        # Hints, pre-composed one strip per axis
+        background.blit(self.row_hint_strip, ROW_HINT_STRIP_POS)
+        background.blit(self.col_hint_strip, COL_HINT_STRIP_POS)
+
+        return background
+
+    def generate_board(self):
+        # The level configurations are assumed to be provided
+        configurations = LEVEL_CONFIGURATIONS.get(self.level, _FALLBACK_CONFIGS)
+        config = random.choice(configurations)
+        num_2s = config['2s']
+        num_3s = config['3s']
+        num_voltorbs = config['Voltorbs']
+
+        # Voltorbs are stored as value 0; everything else is its multiplier.
+        # Fill the flat array by slices and shuffle it in place, so no
+        # per-cell Python objects are allocated during generation.
+        cells = np.empty(BOARD_SIZE * BOARD_SIZE, dtype=np.int8)
+        cells[:num_voltorbs] = 0
+        cells[num_voltorbs:num_voltorbs + num_2s] = 2
+        cells[num_voltorbs + num_2s:num_voltorbs + num_2s + num_3s] = 3
+        cells[num_voltorbs + num_2s + num_3s:] = 1
+
+        _rng.shuffle(cells)
+        return cells.reshape(BOARD_SIZE, BOARD_SIZE)
+
+    def calculate_hints(self):
+        # Compute the masked point values once; both axes reduce the
+        # same product, so the values are only read in a single pass
+        points = self.values * ~self.is_voltorb
+
+        row_hints = list(zip(points.sum(axis=1).tolist(), self.is_voltorb.sum(axis=1).tolist()))
+        col_hints = list(zip(points.sum(axis=0).tolist(), self.is_voltorb.sum(axis=0).tolist()))
+
+        return row_hints, col_hints
+
+    def check_win(self):
+        return (self.gt1_mask & ~self.flipped_bb & FULL_BOARD_MASK) == 0
+
+    def flip_cell(self, row, col):
+        bit = 1 << (row * BOARD_SIZE + col)
+        if self.flipped_bb & bit:
+            return
+        self.flipped_bb |= bit
+        self.dirty = True
+        self.dirty_rects.append(CELL_RECTS[row][col])
+        if self.voltorb_bb & bit:
+            self.game_over = True
+        else:
+            value = int(self.values[row, col])
+            if value > 1:
+                self.score *= value
+                self.dirty_rects.append(SIDEBAR_RECT)  # Current points changed
+            if self.check_win():
+                self.win = True
+
+    def toggle_mark(self, row, col):
+        bit = 1 << (row * BOARD_SIZE + col)
+        if not self.flipped_bb & bit:
+            self.marked_bb ^= bit
+            self.dirty = True
+            self.dirty_rects.append(CELL_RECTS[row][col])
+
+# Possible outcomes of a level decrease roll; None means reset to Level 1
+_DECREASE_OUTCOMES = (
+    (0, "no change"),
+    (-1, "decreased by 1"),
+    (-2, "decreased by 2"),
+    (None, "reset to Level 1"),
+)
+
+# Per-level cumulative weights for the outcome draw, precomputed so
+# calculate_level_decrease does no arithmetic on the hot path. The total
+# decrease chance is 10% at level 1, +5% per level, capped at 90%; within
+# it the split is 70% by 1, 20% by 2, 10% reset to Level 1.
+def _decrease_cum_weights(level):
+    total = min(0.9, 0.1 + (level - 1) * 0.05)
+    return (1.0 - total, 1.0 - 0.3 * total, 1.0 - 0.1 * total, 1.0)
+
+_DECREASE_CUM_WEIGHTS = [_decrease_cum_weights(level) for level in range(1, 65)]
+
+def calculate_level_decrease(level):
+    cum_weights = _DECREASE_CUM_WEIGHTS[min(level, len(_DECREASE_CUM_WEIGHTS)) - 1]
+    delta, message = random.choices(_DECREASE_OUTCOMES, cum_weights=cum_weights)[0]
+
+    if delta is None:
+        return 1, message
+    return max(1, level + delta), message
+
+def draw_board(screen, board, high_score, level_decrease_message=""):
+    # Static layer: unflipped cells, borders and hints in a single blit
+    screen.blit(board.background, (0, 0))
+
+    # Overdraw only the cells that differ from the static layer
+    changed_bb = board.flipped_bb | board.marked_bb
+    for row in range(BOARD_SIZE):
+        for col in range(BOARD_SIZE):
+            bit = 1 << (row * BOARD_SIZE + col)
+            if not changed_bb & bit:
+                continue
+            cell_rect = CELL_RECTS[row][col]
+            if board.flipped_bb & bit:
+                if board.voltorb_bb & bit:
+                    pygame.draw.rect(screen, RED, cell_rect)
+                    text = GLYPHS["V"]
+                else:
+                    pygame.draw.rect(screen, LIGHT_GRAY, cell_rect)
+                    text = GLYPHS[str(int(board.values[row, col]))]
+            else:
+                text = GLYPHS["!"]
+            text_rect = text.get_rect(center=cell_rect.center)
+            screen.blit(text, text_rect)
+            pygame.draw.rect(screen, BLACK, cell_rect, 1)
+
+    # Sidebar texts are top-left anchored, so blit takes the precomputed
+    # position directly and no Rect is built per frame
+    screen.blit(render_cached(score_font, f"Level: {board.level}", BLACK), SIDEBAR_TEXT_POS['level'])
+    screen.blit(render_cached(score_font, f"Current Points: {board.score}", BLACK), SIDEBAR_TEXT_POS['score'])
+    screen.blit(render_cached(score_font, f"Total Score: {board.total_score}", BLACK), SIDEBAR_TEXT_POS['total_score'])
+    screen.blit(render_cached(score_font, f"High Score: {high_score}", BLACK), SIDEBAR_TEXT_POS['high_score'])
+
+    # Game over or win messages with background for better readability
+    if board.game_over:
+        # Semi-transparent background
+        screen.blit(OVERLAY, (0, 0))
+
+        screen.blit(*render_cached_at(title_font, "Game Over!", RED,
+                                      'center', (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60)))
+
+        # Display level decrease message if any
+        if level_decrease_message:
+            screen.blit(*render_cached_at(score_font, level_decrease_message, BLACK,
+                                          'center', (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20)))
+
+        screen.blit(*render_cached_at(small_font, "Press Enter to continue", BLACK,
+                                      'center', (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20)))
+
+    if board.win:
+        # Semi-transparent background
+        screen.blit(OVERLAY, (0, 0))
+
+        screen.blit(*render_cached_at(title_font, "Level Cleared!", BLACK,
+                                      'center', (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20)))
+
+        screen.blit(*render_cached_at(small_font, "Press Enter to continue", BLACK,
+                                      'center', (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20)))
+
+def save_score(total_score, high_score):
+    # Two little-endian unsigned 64-bit integers; fixed-size, fast to
+    # parse and safe against the arbitrary code execution pickle allows
+    with open('score.dat', 'wb') as f:
+        f.write(struct.pack('<QQ', total_score, high_score))
+
+def load_score():
+    if not os.path.exists('score.dat'):
+        return 0, 0
+    with open('score.dat', 'rb') as f:
+        data = f.read()
+
+    if data[:1] == b'\x80':
+        # Pickle protocol marker: score saved by a previous version.
+        # Migrate it to the struct format once.
+        try:
+            legacy = pickle.loads(data)
+        except Exception:
+            return 0, 0
+        if isinstance(legacy, dict):
+            total_score = legacy.get('total_score', 0)
+            high_score = legacy.get('high_score', 0)
+        else:
+            # Data is an int (from an even older version)
+            total_score = legacy
+            high_score = 0
+        save_score(total_score, high_score)
+        return total_score, high_score
+
+    if len(data) < 16:
+        return 0, 0
+    total_score, high_score = struct.unpack('<QQ', data[:16])
+    return total_score, high_score
+
+def main():
+    total_score, high_score = load_score()
+    level = 1
+    board = Board(level, total_score)
+    running = True
+    show_level_menu = True  # To choose level or spend points
+    level_decrease_message = ""
+
+    while running:
+        # The game is purely event-driven, so sleep in the OS until an
+        # event arrives instead of polling; the timeout keeps the loop
+        # from blocking indefinitely on shutdown-time edge cases
+        event = pygame.event.wait(100)
+
+        if event.type == pygame.QUIT:
+            save_score(board.total_score, high_score)
+            running = False
+            break
+
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if not board.game_over and not board.win and not show_level_menu:
+                mouse_x, mouse_y = pygame.mouse.get_pos()
+                # Calculate which cell was clicked directly from the
+                # coordinates instead of hit-testing all 25 cell rects
+                cell_pitch = CELL_SIZE + CELL_MARGIN
+                dx = mouse_x - X_MARGIN
+                dy = mouse_y - Y_MARGIN
+                if 0 <= dx < BOARD_SIZE * cell_pitch and 0 <= dy < BOARD_SIZE * cell_pitch:
+                    col, col_rem = divmod(int(dx), cell_pitch)
+                    row, row_rem = divmod(int(dy), cell_pitch)
+                    # Ignore clicks that land in the margin between cells
+                    if col_rem < CELL_SIZE and row_rem < CELL_SIZE:
+                        if event.button == 1:  # Left click
+                            board.flip_cell(row, col)
+                        elif event.button == 3:  # Right click
+                            board.toggle_mark(row, col)
+
+        elif event.type == pygame.KEYDOWN:
+            # Accept both Enter keys
+            if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+                if show_level_menu:
+                    show_level_menu = False
+                    level_decrease_message = ""
+                    board.dirty = True
+                elif board.win:
+                    # Add current round score to total score
+                    board.total_score += board.score
+                    if board.total_score > high_score:
+                        high_score = board.total_score
+                    save_score(board.total_score, high_score)
+                    level = board.level + 1
+                    board = Board(level, board.total_score)
+                    show_level_menu = True
+                elif board.game_over:
+                    # Lose current round score
+                    # Apply level decrease logic
+                    new_level, decrease_message = calculate_level_decrease(level)
+                    level_decrease_message = f"Your level has {decrease_message}."
+                    level = new_level
+                    if board.total_score > high_score:
+                        high_score = board.total_score
+                    save_score(board.total_score, high_score)
+                    board = Board(level, board.total_score)
+                    show_level_menu = True
+            elif event.key == pygame.K_s and show_level_menu:
+                # Spend points to increase level
+                if board.total_score >= 100:
+                    board.total_score -= 100
+                    level += 1
+                    board = Board(level, board.total_score)
+                    save_score(board.total_score, high_score)
+            elif event.key == pygame.K_r and show_level_menu:
+                # Reset total score
+                board.total_score = 0
+                save_score(board.total_score, high_score)
+                board.dirty = True
+
+        # Redraw only when some state actually changed
+        if not board.dirty:
+            continue
+        board.dirty = False
+
+        screen.fill(WHITE)
+        if show_level_menu:
+            # Display level and options to spend points
+            # Center x position for menu text (adjusted for sidebar)
+            menu_center_x = SIDEBAR_WIDTH + ((SCREEN_WIDTH - SIDEBAR_WIDTH) // 2)
+
+            # Semi-transparent background for menu
+            screen.blit(OVERLAY, (0, 0))
+
+            screen.blit(*render_cached_at(title_font, f"Current Level: {level}", BLACK,
+                                          'center', (menu_center_x, SCREEN_HEIGHT // 2 - 120)))
+
+            screen.blit(*render_cached_at(title_font, f"Total Score: {board.total_score}", BLACK,
+                                          'center', (menu_center_x, SCREEN_HEIGHT // 2 - 80)))
+
+            screen.blit(*render_cached_at(title_font, f"High Score: {high_score}", BLACK,
+                                          'center', (menu_center_x, SCREEN_HEIGHT // 2 - 40)))
+
+            instructions = [
+                "Press Enter to start the game",
+                "Press 'S' to spend 100 points to increase level",
+                "Press 'R' to reset total score",
+                "Left-click to reveal a cell",
+                "Right-click to mark/unmark a cell",
+            ]
+
+            for i, line in enumerate(instructions):
+                screen.blit(*render_cached_at(small_font, line, BLACK,
+                                              'center', (menu_center_x, SCREEN_HEIGHT // 2 + i * 30)))
+        else:
+            draw_board(screen, board, high_score, level_decrease_message)
+
+        if board.dirty_rects and not (show_level_menu or board.game_over or board.win):
+            # Only cell flips/marks happened: push just those regions
+            pygame.display.update(board.dirty_rects)
+        else:
+            # Full redraw (new board, menu transition or overlay)
+            pygame.display.flip()
+        board.dirty_rects.clear()
+
+    pygame.quit()
+    sys.exit()
+
+if __name__ == "__main__":
+    main()